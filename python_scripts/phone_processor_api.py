@@ -7,20 +7,65 @@ NEW: Added splitting and plus-stripping options.
 """
 
 import pandas as pd
+import numpy as np
 import requests
 import re
 import json
 import argparse
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set
-from tqdm import tqdm
+from typing import Optional
 from openpyxl.utils import get_column_letter
 import zipfile
 import io  # Required for in-memory zipping
 import xlsxwriter
 
+try:
+    import numba
+except ImportError:  # numba is optional; blocklist ingestion falls back to Python
+    numba = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    from charset_normalizer import from_bytes as _detect_encoding
+except ImportError:  # optional; load_file falls back to trying encodings blindly
+    _detect_encoding = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; the API response is buffered instead
+    ijson = None
+
+# Parse failures fetch_blocklist should report instead of raising
+_JSON_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+# Compiled once at import; normalize_phone_number runs per record on the
+# fallback paths, so skip the re-cache lookup on every call.
+_RE_KEEP = re.compile(r'[^\d+]')
+_RE_NON_DIGIT = re.compile(r'\D')
+_LOCAL_PREFIXES = ('2', '3')
+
+# Deletion table for the ASCII fast path: str.translate runs in C and beats
+# the regex engine for a plain character-class filter.
+_DEL_TABLE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(256) if chr(i) not in set('0123456789+')))
+
+# Arrow-backed strings keep the column in packed UTF-8 buffers, so the .str
+# kernels and isin run in C++ instead of over boxed Python objects.
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
 def normalize_phone_number(phone) -> Optional[str]:
     """
     Normalize a phone number to international E.164 format.
@@ -28,17 +73,28 @@ def normalize_phone_number(phone) -> Optional[str]:
     """
     if pd.isna(phone):
         return None
-    
+
     phone_str = str(phone)
     if phone_str.endswith('.0'):
         phone_str = phone_str[:-2]
-    
+
+    return _normalize_cached(phone_str)
+
+@lru_cache(maxsize=2**20)
+def _normalize_cached(phone_str: str) -> Optional[str]:
+    """Cached core of normalize_phone_number; marketing lists repeat numbers
+    often, so repeated inputs skip the cleanup and branch chain entirely."""
     phone_str = phone_str.strip()
     if not phone_str or phone_str.startswith('*'):
         return None
 
-    cleaned = re.sub(r'[^\d+]', '', phone_str)
-    if len(re.sub(r'\D', '', cleaned)) < 8:
+    if phone_str.isascii():
+        cleaned = phone_str.translate(_DEL_TABLE)
+        digit_count = len(cleaned) - cleaned.count('+')
+    else:
+        cleaned = _RE_KEEP.sub('', phone_str)
+        digit_count = len(_RE_NON_DIGIT.sub('', cleaned))
+    if digit_count < 8:
         return None
 
     if cleaned.startswith('+'):
@@ -52,18 +108,204 @@ def normalize_phone_number(phone) -> Optional[str]:
         return f"+40{cleaned[1:]}"
     if len(cleaned) == 9 and cleaned.startswith('7'):
         return f"+40{cleaned}"
-    if len(cleaned) in [8, 9] and cleaned.startswith(('2', '3')):
+    if len(cleaned) in [8, 9] and cleaned.startswith(_LOCAL_PREFIXES):
         return f"+40{cleaned}"
 
     if len(cleaned) >= 11:
         return f"+{cleaned}"
-    
+
     return None
 
+def normalize_phone_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized version of normalize_phone_number for whole DataFrame columns.
+    Runs the same cleanup and prefix rules through pandas' string kernels
+    instead of a per-row Python apply; invalid entries come back as None.
+    """
+    s = series.astype(_STRING_DTYPE)
+    s = s.str.removesuffix('.0').str.strip()
+    usable = s.notna() & (s != '') & ~s.str.startswith('*', na=False)
+
+    cleaned = s.str.replace(_RE_KEEP, '', regex=True)
+    digit_count = cleaned.str.replace(_RE_NON_DIGIT, '', regex=True).str.len()
+    length = cleaned.str.len()
+
+    conditions = [
+        (~usable | (digit_count < 8)).fillna(True).to_numpy(),
+        cleaned.str.startswith('+', na=False).to_numpy(),
+        cleaned.str.startswith('40', na=False).to_numpy(),
+        cleaned.str.startswith('0040', na=False).to_numpy(),
+        (cleaned.str.startswith('0', na=False) & (length > 8)).fillna(False).to_numpy(),
+        ((length == 9) & cleaned.str.startswith('7', na=False)).fillna(False).to_numpy(),
+        (length.isin([8, 9]) & cleaned.str.startswith(('2', '3'), na=False)).fillna(False).to_numpy(),
+        (length >= 11).fillna(False).to_numpy(),
+    ]
+    choices = [
+        np.full(len(s), None, dtype=object),
+        cleaned.to_numpy(dtype=object),
+        ('+' + cleaned).to_numpy(dtype=object),
+        ('+' + cleaned.str[2:]).to_numpy(dtype=object),
+        ('+40' + cleaned.str[1:]).to_numpy(dtype=object),
+        ('+40' + cleaned).to_numpy(dtype=object),
+        ('+40' + cleaned).to_numpy(dtype=object),
+        ('+' + cleaned).to_numpy(dtype=object),
+    ]
+    return pd.Series(np.select(conditions, choices, default=None),
+                     index=series.index, dtype=object).astype(_STRING_DTYPE)
+
+if numba is not None:
+    @numba.njit(cache=True, nogil=True)
+    def _normalize_batch(flat, offsets, out_buf, out_offsets):
+        """
+        Byte-level state machine equivalent of normalize_phone_number,
+        applied to a whole batch in one compiled call. Input strings are
+        packed into `flat` (uint8) with item boundaries in `offsets`;
+        normalized output is packed the same way into `out_buf`/`out_offsets`
+        (empty slice = invalid number).
+        """
+        n = offsets.shape[0] - 1
+        out_pos = 0
+        for i in range(n):
+            out_offsets[i] = out_pos
+            start = offsets[i]
+            end = offsets[i + 1]
+            # trailing '.0' from float-typed inputs
+            if end - start >= 2 and flat[end - 2] == 0x2E and flat[end - 1] == 0x30:
+                end -= 2
+            # whitespace strip
+            while start < end and (flat[start] == 0x20 or 0x09 <= flat[start] <= 0x0D):
+                start += 1
+            while end > start and (flat[end - 1] == 0x20 or 0x09 <= flat[end - 1] <= 0x0D):
+                end -= 1
+            if start >= end or flat[start] == 0x2A:  # empty or '*'-prefixed
+                continue
+            # filter to [0-9+], reserving 3 bytes in front for a prefix
+            cstart = out_pos + 3
+            cpos = cstart
+            digits = 0
+            for j in range(start, end):
+                c = flat[j]
+                if 0x30 <= c <= 0x39:
+                    out_buf[cpos] = c
+                    cpos += 1
+                    digits += 1
+                elif c == 0x2B:
+                    out_buf[cpos] = c
+                    cpos += 1
+            if digits < 8:
+                continue
+            clen = cpos - cstart
+            first = out_buf[cstart]
+            fstart = -1
+            if first == 0x2B:  # already '+...'
+                fstart = cstart
+            elif first == 0x34 and out_buf[cstart + 1] == 0x30:  # '40...'
+                out_buf[cstart - 1] = 0x2B
+                fstart = cstart - 1
+            elif (first == 0x30 and out_buf[cstart + 1] == 0x30
+                  and out_buf[cstart + 2] == 0x34 and out_buf[cstart + 3] == 0x30):  # '0040...'
+                out_buf[cstart + 1] = 0x2B
+                fstart = cstart + 1
+            elif first == 0x30 and clen > 8:  # '0xxxxxxxx' -> '+40xxxxxxxx'
+                out_buf[cstart - 2] = 0x2B
+                out_buf[cstart - 1] = 0x34
+                fstart = cstart - 2
+            elif clen == 9 and first == 0x37:  # '7xxxxxxxx' -> '+407xxxxxxxx'
+                out_buf[cstart - 3] = 0x2B
+                out_buf[cstart - 2] = 0x34
+                out_buf[cstart - 1] = 0x30
+                fstart = cstart - 3
+            elif (clen == 8 or clen == 9) and (first == 0x32 or first == 0x33):
+                out_buf[cstart - 3] = 0x2B
+                out_buf[cstart - 2] = 0x34
+                out_buf[cstart - 1] = 0x30
+                fstart = cstart - 3
+            elif clen >= 11:
+                out_buf[cstart - 1] = 0x2B
+                fstart = cstart - 1
+            if fstart >= 0:
+                if fstart != out_pos:
+                    for j in range(fstart, cpos):
+                        out_buf[out_pos + (j - fstart)] = out_buf[j]
+                out_pos += cpos - fstart
+        out_offsets[n] = out_pos
+
+def _normalize_with_numba(raw_numbers) -> list:
+    """Pack raw numbers into one bytes blob and run the compiled batch kernel."""
+    encoded = [str(num).encode('utf-8', 'ignore') for num in raw_numbers]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    for i, item in enumerate(encoded):
+        offsets[i + 1] = offsets[i] + len(item)
+    flat = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    out_buf = np.empty(int(offsets[-1]) + 4 * len(encoded) + 4, dtype=np.uint8)
+    out_offsets = np.empty(len(encoded) + 1, dtype=np.int64)
+    _normalize_batch(flat, offsets, out_buf, out_offsets)
+    out_bytes = out_buf[:out_offsets[-1]].tobytes()
+    return [out_bytes[out_offsets[i]:out_offsets[i + 1]].decode('ascii')
+            for i in range(len(encoded))
+            if out_offsets[i + 1] > out_offsets[i]]
+
+def _write_csv(df: pd.DataFrame, dest) -> None:
+    """
+    Write a DataFrame as CSV through Arrow's multithreaded C++ writer when
+    pyarrow is available, falling back to DataFrame.to_csv. `dest` is either
+    a file path or a writable binary stream (e.g. an open zip member).
+    """
+    if _STRING_DTYPE == 'string[pyarrow]':
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            # Binary columns (non-UTF-8 text) fail with ArrowInvalid midway
+            # through write_csv; check the schema before any bytes hit dest
+            # so the pandas fallback below starts from a clean stream.
+            if not any(pa.types.is_binary(field.type)
+                       or pa.types.is_large_binary(field.type)
+                       for field in table.schema):
+                pacsv.write_csv(table, dest)
+                return
+        except Exception:
+            pass  # Arrow can't represent this frame; use pandas' writer
+    if hasattr(dest, 'write'):
+        with io.TextIOWrapper(dest, encoding='utf-8', newline='') as text_stream:
+            df.to_csv(text_stream, index=False, lineterminator='\n')
+    else:
+        df.to_csv(dest, index=False, encoding='utf-8', lineterminator='\n')
+
+def _chunk_to_xlsx_bytes(df_chunk: pd.DataFrame) -> bytes:
+    """Serialize one chunk to an in-memory XLSX workbook (runs in a worker process)."""
+    with io.BytesIO() as excel_buffer:
+        with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
+            df_chunk.to_excel(writer, sheet_name='Telefon_Filtered', index=False)
+        return excel_buffer.getvalue()
+
+def _filter_pass(values: np.ndarray, blocklist: frozenset):
+    """
+    Single-traversal fallback for process_file: normalize, count valid
+    numbers, and flag blocked rows in one loop with side-effect counters
+    instead of separate notna/isin sweeps over the whole column.
+    Returns (keep_mask, valid_count, blocked_count).
+    """
+    keep = np.ones(len(values), dtype=bool)
+    valid_count = 0
+    blocked_count = 0
+    for i, value in enumerate(values):
+        normalized = normalize_phone_number(value)
+        if normalized is None:
+            continue
+        valid_count += 1
+        if normalized in blocklist:
+            blocked_count += 1
+            keep[i] = False
+    return keep, valid_count, blocked_count
+
 class PhoneBlocklistProcessor:
     def __init__(self, api_url: str, json_output: bool = False):
         self.api_url = api_url
-        self.blocklist: Set[str] = set()
+        self.blocklist: frozenset = frozenset()
+        # Same numbers as an object ndarray so Series.isin takes the
+        # hash-table fast path instead of per-element set lookups.
+        self._blocklist_arr = np.empty(0, dtype=object)
         self.json_output = json_output
         self.stats = {}
     
@@ -77,27 +319,59 @@ class PhoneBlocklistProcessor:
         self.log("Fetching blocklist from API...")
         
         try:
-            with requests.Session() as session:
-                response = session.get(self.api_url, timeout=30)
-                response.raise_for_status()
-            data = response.json()
-            
-            if data.get('status') != 0:
-                self.log(f"API Error: {data.get('message', 'Unknown error')}")
-                return False
-                
-            api_records = data.get('details', [])
-            raw_numbers = [item.get('phonenumber') for item in api_records if item.get('phonenumber')]
-            normalized_numbers = [norm for norm in (normalize_phone_number(n) for n in raw_numbers) if norm]
+            if ijson is not None:
+                # Stream the response body: records are parsed as the bytes
+                # arrive, so the full JSON document is never held in memory.
+                status = None
+                message = None
+                record_count = 0
+                raw_numbers = []
+                with requests.Session() as session:
+                    with session.get(self.api_url, timeout=30, stream=True) as response:
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        for prefix, event, value in ijson.parse(response.raw):
+                            if prefix == 'status':
+                                status = value
+                            elif prefix == 'message':
+                                message = value
+                            elif prefix == 'details.item' and event == 'start_map':
+                                record_count += 1
+                            elif prefix == 'details.item.phonenumber' and value:
+                                raw_numbers.append(value)
+                if status != 0:
+                    self.log(f"API Error: {message or 'Unknown error'}")
+                    return False
+            else:
+                with requests.Session() as session:
+                    response = session.get(self.api_url, timeout=30)
+                    response.raise_for_status()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
+
+                if data.get('status') != 0:
+                    self.log(f"API Error: {data.get('message', 'Unknown error')}")
+                    return False
+
+                api_records = data.get('details', [])
+                record_count = len(api_records)
+                raw_numbers = [item.get('phonenumber') for item in api_records if item.get('phonenumber')]
+            if numba is not None and raw_numbers:
+                normalized_numbers = _normalize_with_numba(raw_numbers)
+            else:
+                normalized_numbers = [norm for norm in (normalize_phone_number(n) for n in raw_numbers) if norm]
             initial_count = len(normalized_numbers)
-            self.blocklist = set(normalized_numbers)
+            self.blocklist = frozenset(normalized_numbers)
+            self._blocklist_arr = np.asarray(list(self.blocklist), dtype=object)
             
             # Store stats
             self.stats['blocklist_size'] = len(self.blocklist)
             self.stats['duplicates_removed'] = initial_count - len(self.blocklist)
             
             self.log(f"\n📊 API BLOCKLIST PROCESSING REPORT:")
-            self.log(f"   Total API records: {len(api_records):,}")
+            self.log(f"   Total API records: {record_count:,}")
             self.log(f"   Valid, normalized numbers: {initial_count:,}")
             self.log(f"   Duplicates removed: {initial_count - len(self.blocklist):,}")
             self.log(f"   ✓ Final unique blocklist size: {len(self.blocklist):,}")
@@ -107,7 +381,7 @@ class PhoneBlocklistProcessor:
         except requests.RequestException as e:
             self.log(f"Error fetching blocklist: {e}")
             return False
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:  # json/orjson decode errors and ijson parse errors
             self.log(f"Error parsing API response: {e}")
             return False
 
@@ -120,44 +394,40 @@ class PhoneBlocklistProcessor:
             if path.suffix.lower() in ['.xlsx', '.xls']:
                 df = pd.read_excel(file_path)
             elif path.suffix.lower() == '.csv':
-                # Enhanced CSV reading to handle various BOM types and quote issues
-                encodings_to_try = [
-                    'utf-8-sig',    # UTF-8 with BOM (EF BB BF)
-                    'utf-16',       # UTF-16 with BOM (FF FE or FE FF) 
-                    'utf-8',        # Plain UTF-8
-                    'latin1',       # Windows-1252/ISO-8859-1
-                    'cp1252'        # Windows code page
-                ]
-                
                 df = None
-                for encoding in encodings_to_try:
+
+                # Fast path: Arrow's multithreaded C++ reader. It handles
+                # UTF-8 (with or without BOM) and raises quickly on anything
+                # else, in which case the encoding cascade below takes over.
+                if _STRING_DTYPE == 'string[pyarrow]':
                     try:
-                        # Try with proper quote handling
-                        df = pd.read_csv(file_path, encoding=encoding, engine='python', 
-                                       quoting=1, on_bad_lines='warn')
-                        self.log(f"✓ Successfully parsed CSV with {encoding} encoding")
-                        break
+                        import pyarrow as pa
+                        from pyarrow import csv as pacsv
+                        table = pacsv.read_csv(file_path)
+                        # Arrow accepts latin1/cp1252 files but infers their
+                        # text columns as binary (raw undecoded bytes); only
+                        # keep the table when everything decoded as real text,
+                        # otherwise let the encoding cascade handle the file.
+                        if any(pa.types.is_binary(field.type)
+                               or pa.types.is_large_binary(field.type)
+                               for field in table.schema):
+                            df = None
+                        else:
+                            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+                            self.log("✓ Successfully parsed CSV with the pyarrow reader")
                     except Exception:
-                        try:
-                            # Try with more permissive parsing
-                            df = pd.read_csv(file_path, encoding=encoding, engine='python',
-                                           sep=None, quoting=3, on_bad_lines='warn')
-                            self.log(f"✓ Successfully parsed CSV with {encoding} (flexible)")
-                            break
-                        except Exception:
-                            continue
-                
+                        df = None
+
                 if df is None:
-                    # Final fallback: Very basic parsing
-                    df = pd.read_csv(file_path, encoding='utf-8', engine='python',
-                                   on_bad_lines='skip', quoting=3, encoding_errors='replace')
-                    self.log(f"✓ Parsed CSV with fallback (some characters may be replaced)")
+                    df = self._read_csv_with_fallbacks(file_path)
             else:
                 self.log(f"Error: Unsupported file format '{path.suffix}'. Please use CSV or Excel.")
                 return None
                 
-            # Clean column names - remove BOM and whitespace
-            df.columns = df.columns.str.strip().str.replace('\ufeff', '')
+            # Clean column names - remove BOM and whitespace. A plain
+            # comprehension beats two .str passes that each build an Index,
+            # and the BOM can only lead the first column name.
+            df.columns = [col.strip().lstrip('\ufeff') for col in df.columns]
                 
             self.log(f"✓ Successfully loaded file with {len(df):,} rows and {len(df.columns)} columns.")
             self.log(f"✓ Columns found: {list(df.columns)}")
@@ -170,28 +440,86 @@ class PhoneBlocklistProcessor:
             self.log(f"Error loading file: {e}")
             return None
 
+    def _read_csv_with_fallbacks(self, file_path: str) -> pd.DataFrame:
+        """Enhanced CSV reading to handle various BOM types and quote issues."""
+        # Sniff the encoding once from the first 64 KB instead of re-parsing
+        # the whole file under every candidate encoding; the detected one
+        # goes straight to the fast C engine.
+        if _detect_encoding is not None:
+            try:
+                with open(file_path, 'rb') as fh:
+                    best = _detect_encoding(fh.read(65536)).best()
+                if best is not None:
+                    encoding = best.encoding
+                    if best.bom and encoding == 'utf_8':
+                        encoding = 'utf-8-sig'
+                    df = pd.read_csv(file_path, encoding=encoding, engine='c',
+                                   quoting=1, on_bad_lines='warn')
+                    self.log(f"✓ Successfully parsed CSV with detected {encoding} encoding")
+                    return df
+            except Exception:
+                pass
+
+        encodings_to_try = [
+            'utf-8-sig',    # UTF-8 with BOM (EF BB BF)
+            'utf-16',       # UTF-16 with BOM (FF FE or FE FF)
+            'utf-8',        # Plain UTF-8
+            'latin1',       # Windows-1252/ISO-8859-1
+            'cp1252'        # Windows code page
+        ]
+
+        for encoding in encodings_to_try:
+            try:
+                # Try with proper quote handling
+                df = pd.read_csv(file_path, encoding=encoding, engine='python',
+                               quoting=1, on_bad_lines='warn')
+                self.log(f"✓ Successfully parsed CSV with {encoding} encoding")
+                return df
+            except Exception:
+                try:
+                    # Try with more permissive parsing
+                    df = pd.read_csv(file_path, encoding=encoding, engine='python',
+                                   sep=None, quoting=3, on_bad_lines='warn')
+                    self.log(f"✓ Successfully parsed CSV with {encoding} (flexible)")
+                    return df
+                except Exception:
+                    continue
+
+        # Final fallback: Very basic parsing
+        df = pd.read_csv(file_path, encoding='utf-8', engine='python',
+                       on_bad_lines='skip', quoting=3, encoding_errors='replace')
+        self.log(f"✓ Parsed CSV with fallback (some characters may be replaced)")
+        return df
+
     def process_file(self, df: pd.DataFrame, phone_col: str) -> pd.DataFrame:
         """Process the DataFrame and return only 'telefon' column with filtered numbers."""
         self.log(f"\n⚙️  Processing {len(df):,} rows from column '{phone_col}'...")
         
         start_time = time.time()
         
-        # Normalize phone numbers
-        if not self.json_output:
-            tqdm.pandas(desc="   Normalizing numbers", unit=" numbers")
-            normalized_numbers = df[phone_col].progress_apply(normalize_phone_number)
+        self.log("   Normalizing numbers...")
+        if _STRING_DTYPE == 'string[pyarrow]':
+            # Vectorized path: normalize each distinct raw value once and
+            # broadcast the results back over the column, then filter against
+            # the blocklist with a hash join. Keep only numbers NOT in
+            # blocklist.
+            unique_raw = df[phone_col].drop_duplicates()
+            unique_norm = normalize_phone_series(unique_raw)
+            normalized_numbers = df[phone_col].map(dict(zip(unique_raw, unique_norm)))
+            is_blocked = normalized_numbers.isin(self._blocklist_arr)
+            keep_mask = ~is_blocked
+            valid_normalized = int(normalized_numbers.notna().sum())
+            blocked_numbers = int(is_blocked.sum())
         else:
-            normalized_numbers = df[phone_col].apply(normalize_phone_number)
-        
-        # Filter against blocklist - keep only numbers NOT in blocklist
-        is_blocked = normalized_numbers.isin(self.blocklist)
-        
+            # Fused fallback: one pass over the column computes the keep
+            # mask and both counters without extra full-array sweeps.
+            keep_mask, valid_normalized, blocked_numbers = _filter_pass(
+                df[phone_col].to_numpy(), self.blocklist)
+
         # Create output DataFrame keeping all original columns
-        output_df = df[~is_blocked].copy()
-        
+        output_df = df[keep_mask].copy()
+
         total_rows = len(df)
-        valid_normalized = normalized_numbers.notna().sum()
-        blocked_numbers = is_blocked.sum()
         
         # Store processing stats
         processing_time = time.time() - start_time
@@ -226,12 +554,15 @@ class PhoneBlocklistProcessor:
         
         base_path = str(Path(output_path).with_suffix(''))
         
-        # Create a copy to avoid modifying the original DataFrame
-        final_df = df.copy()
-        
+        # Copy only when we are about to mutate the phone column; the
+        # no-strip path can export df as-is without duplicating it.
+        final_df = df.copy() if strip_plus else df
+
         if strip_plus:
             self.log(f"   Stripping '+' from phone numbers in '{phone_col}'.")
-            final_df[phone_col] = final_df[phone_col].astype(str).str.replace('+', '', regex=False)
+            # '+' can only be a prefix in E.164 output, so lstrip beats a
+            # full-string replace and skips strings without one entirely.
+            final_df[phone_col] = final_df[phone_col].astype(str).str.lstrip('+')
 
         try:
             if split_size > 0:
@@ -250,32 +581,29 @@ class PhoneBlocklistProcessor:
                 self.log(f"   Creating CSV zip: {zip_path_csv}")
                 with zipfile.ZipFile(zip_path_csv, 'w', zipfile.ZIP_DEFLATED) as zipf_csv:
                     for i, start in enumerate(range(0, len(final_df), split_size)):
-                        end = min(start + split_size, len(final_df))
-                        df_chunk = final_df.iloc[start:end]
+                        df_chunk = final_df.iloc[start:start + split_size]
                         part_num = i + 1
                         chunk_csv_name = f"filtered_part_{part_num}.csv"
                         self.log(f"     ...writing {chunk_csv_name} ({len(df_chunk):,} rows)")
-                        csv_data = df_chunk.to_csv(index=False, encoding='utf-8', lineterminator='\n')
-                        zipf_csv.writestr(chunk_csv_name, csv_data)
+                        # Stream straight into the zip member; no intermediate
+                        # full-chunk string in memory.
+                        with zipf_csv.open(chunk_csv_name, 'w', force_zip64=True) as member:
+                            _write_csv(df_chunk, member)
                 
                 # --- Create Excel Zip ---
+                # xlsxwriter is pure Python and CPU-bound, so serialize the
+                # chunks in worker processes and append the finished blobs
+                # to the zip in order.
                 self.log(f"   Creating Excel zip: {zip_path_xlsx}")
+                chunks = [final_df.iloc[start:start + split_size]
+                          for start in range(0, len(final_df), split_size)]
                 with zipfile.ZipFile(zip_path_xlsx, 'w', zipfile.ZIP_DEFLATED) as zipf_xlsx:
-                    for i, start in enumerate(range(0, len(final_df), split_size)):
-                        end = min(start + split_size, len(final_df))
-                        df_chunk = final_df.iloc[start:end]
-                        part_num = i + 1
-                        chunk_xlsx_name = f"filtered_part_{part_num}.xlsx"
-                        self.log(f"     ...writing {chunk_xlsx_name} ({len(df_chunk):,} rows)")
-                        
-                        # Write to in-memory buffer
-                        with io.BytesIO() as excel_buffer:
-                            with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
-                                df_chunk.to_excel(writer, sheet_name='Telefon_Filtered', index=False)
-                            # Get buffer value before it's closed
-                            excel_data = excel_buffer.getvalue()
-                        
-                        zipf_xlsx.writestr(chunk_xlsx_name, excel_data)
+                    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                        futures = [pool.submit(_chunk_to_xlsx_bytes, df_chunk) for df_chunk in chunks]
+                        for i, future in enumerate(futures):
+                            chunk_xlsx_name = f"filtered_part_{i + 1}.xlsx"
+                            self.log(f"     ...writing {chunk_xlsx_name} ({len(chunks[i]):,} rows)")
+                            zipf_xlsx.writestr(chunk_xlsx_name, future.result())
 
             else:
                 self.log("   Creating single CSV and Excel files.")
@@ -290,14 +618,28 @@ class PhoneBlocklistProcessor:
                 }
 
                 # 1. Create CSV
-                final_df.to_csv(csv_path, index=False, encoding='utf-8', lineterminator='\n')
+                _write_csv(final_df, csv_path)
                 self.log(f"   ✓ CSV file created: {csv_path}")
 
-                # 2. Create Excel
+                # 2. Create Excel (constant_memory streams rows to disk instead
+                # of holding the whole workbook in memory). That mode flushes
+                # each row as soon as a later one is written, and pandas'
+                # to_excel emits cells column-by-column, so write the rows
+                # directly in row order instead.
                 try:
-                    with pd.ExcelWriter(xlsx_path, engine='xlsxwriter',
-                                        engine_kwargs={'options': {'strings_to_numbers': False}}) as writer:
-                        final_df.to_excel(writer, sheet_name='Telefon_Filtered', index=False)
+                    import xlsxwriter
+                    workbook = xlsxwriter.Workbook(
+                        xlsx_path,
+                        {'constant_memory': True, 'strings_to_numbers': False})
+                    try:
+                        worksheet = workbook.add_worksheet('Telefon_Filtered')
+                        worksheet.write_row(0, 0, [str(col) for col in final_df.columns])
+                        for row_idx, row in enumerate(final_df.itertuples(index=False), start=1):
+                            worksheet.write_row(
+                                row_idx, 0,
+                                [None if pd.isna(cell) else cell for cell in row])
+                    finally:
+                        workbook.close()
                     self.log(f"   ✓ Excel file created: {xlsx_path}")
                 except ImportError:
                     # Fallback to openpyxl
@@ -342,16 +684,19 @@ def main():
     available_columns = list(df.columns)
     phone_column_clean = args.phone_column.strip().replace('\ufeff', '')
     
-    # Try to find the column (exact match, case insensitive, or BOM variations)
-    matched_column = None
+    # Try to find the column (exact match, case insensitive, or BOM variations).
+    # Index every normalized form of each column name once, then match with
+    # dict lookups instead of re-normalizing columns per candidate.
+    col_index = {}
     for col in available_columns:
         col_clean = col.strip().replace('\ufeff', '')
-        if (col == args.phone_column or 
-            col_clean == phone_column_clean or 
-            col.lower() == args.phone_column.lower() or
-            col_clean.lower() == phone_column_clean.lower()):
-            matched_column = col
-            break
+        for key in (col, col_clean, col.lower(), col_clean.lower()):
+            col_index.setdefault(key, col)
+
+    matched_column = (col_index.get(args.phone_column)
+                      or col_index.get(phone_column_clean)
+                      or col_index.get(args.phone_column.lower())
+                      or col_index.get(phone_column_clean.lower()))
     
     if matched_column is None:
         processor.log(f"Error: Column '{args.phone_column}' not found in file.")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Optional AOT build for test_minimal.py.
+
+The Node backend spawns the script once per request, so CPython startup and
+module bytecode compilation dominate its runtime. Compiling it to a C
+extension removes the .py parse and most of the module-init work:
+
+    pip install cython setuptools
+    python setup.py build_ext --inplace
+
+For a standalone binary the Node layer can exec directly:
+
+    cython --embed -3 test_minimal.py
+    gcc test_minimal.c -o test_minimal $(python3-config --cflags --ldflags --embed)
+
+This build is optional; the plain .py script keeps working without it.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='test_minimal',
+    ext_modules=cythonize(
+        'test_minimal.py',
+        language_level=3,
+        compiler_directives={'boundscheck': False},
+    ),
+)
@@ -2,53 +2,247 @@
 """
 Minimal test script to debug the issue
 """
+import os
 import sys
 import json
-import argparse
+
+# Short-lived script spawned per request; skip .pyc generation
+sys.dont_write_bytecode = True
+
+# Debug chatter is buffered and only emitted when PHONE_DEBUG=1, so
+# production runs skip the formatting and per-line stderr flushes entirely.
+DEBUG = os.environ.get('PHONE_DEBUG') == '1'
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json still works, just slower
+    orjson = None
+
+_USAGE = ("usage: test_minimal.py input_file [--output PATH] "
+          "[--phone-column NAME] [--json-output]\n"
+          "       test_minimal.py --worker\n")
+
+# Mock stats template; process() copies it (one C-level memcpy) and fills in
+# the row-dependent fields instead of rebuilding the literal every run.
+# Keys are interned so dict inserts and the JSON key encoder hit the
+# cached-hash fast paths, which matters in --worker mode where the dict is
+# rebuilt per request.
+_STATS_KEYS = tuple(map(sys.intern, (
+    "total_rows", "valid_numbers", "blocked_numbers", "final_rows",
+    "blocklist_size", "processing_time", "duplicates_removed")))
+_STATS_TEMPLATE = dict(zip(_STATS_KEYS, (0, 0, 10, 0, 1000, 1.0, 5)))
+
+class Args:
+    """Parsed CLI options; plain attribute access like argparse's Namespace."""
+
+    def __init__(self):
+        self.input_file = None
+        self.output = None
+        self.phone_column = None
+        self.json_output = False
+        self.worker = False
+
+def parse_args(argv) -> Args:
+    """
+    Hand-rolled parser for this small CLI: one positional plus
+    --output/--phone-column (value flags, '--name value' or '--name=value')
+    and the --json-output/--worker switches. The Node parent only ever
+    passes known flags, so importing and configuring argparse per spawn is
+    dead weight.
+    """
+    args = Args()
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token == '--json-output':
+            args.json_output = True
+            i += 1
+        elif token == '--worker':
+            args.worker = True
+            i += 1
+        elif token.startswith('--'):
+            key, eq, value = token[2:].partition('=')
+            key = key.replace('-', '_')
+            if not eq:
+                value = argv[i + 1] if i + 1 < len(argv) else None
+                i += 2
+            else:
+                i += 1
+            if key not in ('output', 'phone_column'):
+                sys.stderr.write(f"unknown option: {token}\n{_USAGE}")
+                sys.exit(2)
+            setattr(args, key, value)
+        else:
+            args.input_file = token
+            i += 1
+    return args
+
+def process(input_file, phone_column=None, log=lambda msg: None) -> dict:
+    """Compute the mock stats for one input file. Raises on bad input."""
+    if not os.path.isfile(input_file):
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
+    import pandas as pd
+    log("Pandas imported OK")
+
+    total_rows = None
+    columns = None
+
+    # Fastest path: the stats only need a row count and the header, so
+    # count newlines over an mmap (bytes.count hits the libc memchr fast
+    # path) instead of parsing fields. Bail out to the real parsers when
+    # the file has quoted fields (embedded newlines) or doesn't look
+    # like single-byte text.
+    try:
+        import mmap
+        with open(input_file, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                header_end = mm.find(b'\n')
+                if (header_end != -1 and mm.find(b'"') == -1
+                        and b'\x00' not in mm[:header_end]):
+                    columns = (mm[:header_end].decode('utf-8-sig', 'replace')
+                               .rstrip('\r').split(','))
+                    # mmap has find but no count; run bytes.count over
+                    # 4 MB windows of the mapping.
+                    view = memoryview(mm)
+                    try:
+                        newlines = sum(
+                            view[pos:pos + (1 << 22)].tobytes().count(b'\n')
+                            for pos in range(0, len(mm), 1 << 22))
+                    finally:
+                        view.release()
+                    total_rows = newlines - 1
+                    if mm[-1:] != b'\n':  # last line unterminated
+                        total_rows += 1
+            finally:
+                mm.close()
+    except (OSError, ValueError):
+        total_rows = None
+
+    # Polars' lazy scanner pushes the len() down into its Rust CSV
+    # reader, so it counts rows (handling the quoted files the mmap
+    # path refuses) without materializing a DataFrame.
+    if total_rows is None:
+        try:
+            import polars as pl
+            lazy = pl.scan_csv(input_file)
+            if hasattr(lazy, 'collect_schema'):  # polars >= 1.0
+                columns = lazy.collect_schema().names()
+            else:  # 0.20.x (the pinned version) has no collect_schema
+                columns = lazy.columns
+            total_rows = lazy.select(pl.len()).collect().item()
+        except Exception:
+            total_rows = None
+
+    # Arrow's multithreaded reader tokenizes the file without building
+    # pandas objects; only the row count and column names are needed here.
+    if total_rows is None:
+        try:
+            from pyarrow import csv as pacsv
+            table = pacsv.read_csv(
+                input_file,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 23))
+            total_rows = table.num_rows
+            columns = table.column_names
+        except Exception:
+            total_rows = None
+
+    if total_rows is None:
+        # Fallback: stream the CSV in chunks; peak memory is one chunk
+        # instead of the whole file, and usecols limits parsing to the
+        # column we care about.
+        reader = pd.read_csv(
+            input_file, chunksize=100_000,
+            usecols=[phone_column] if phone_column else None,
+            dtype={phone_column: 'string'} if phone_column else None)
+        total_rows = 0
+        for chunk in reader:
+            if columns is None:
+                columns = list(chunk.columns)
+            total_rows += len(chunk)
+    if DEBUG:
+        # Log a truncated preview; repr-ing the whole column list just
+        # for a debug line is wasted allocation on wide files.
+        log(f"CSV loaded: {total_rows} rows, {len(columns or [])} cols, "
+            f"first: {(columns or [])[:5]}")
+
+    # Mock output
+    test_stats = _STATS_TEMPLATE.copy()
+    test_stats["total_rows"] = total_rows
+    test_stats["valid_numbers"] = total_rows - 10
+    test_stats["final_rows"] = total_rows - 20
+    return test_stats
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode('utf-8')
+
+def worker_loop():
+    """
+    Long-lived mode: the Node backend spawns the script once with --worker
+    and pipes one JSON request per stdin line ({"input_file": ...,
+    "phone_column": ...}); each gets one JSON response line on stdout.
+    Interpreter startup and the pandas import amortize across all requests.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = orjson.loads(line) if orjson is not None else json.loads(line)
+            stats = process(request['input_file'], request.get('phone_column'))
+            response = _dumps(stats)
+        except Exception as e:
+            response = _dumps({"error": f"{type(e).__name__}: {e}"})
+        sys.stdout.buffer.write(response)
+        sys.stdout.flush()
 
 def main():
-    print("Test script started", file=sys.stderr)
-    
-    parser = argparse.ArgumentParser(description='Test script')
-    parser.add_argument('input_file', help='Input file path')
-    parser.add_argument('--output', help='Output file path')
-    parser.add_argument('--phone-column', help='Phone column name')
-    parser.add_argument('--json-output', action='store_true', help='JSON output')
-    
+    debug_lines = []
+    log = debug_lines.append if DEBUG else (lambda msg: None)
+    log("Test script started")
+
     try:
-        args = parser.parse_args()
-        print(f"Arguments parsed successfully: {args}", file=sys.stderr)
-        
-        # Test imports
-        import pandas as pd
-        print("Pandas imported OK", file=sys.stderr)
-        
-        import requests
-        print("Requests imported OK", file=sys.stderr)
-        
-        # Try to read the CSV file
-        df = pd.read_csv(args.input_file)
-        print(f"CSV loaded successfully: {len(df)} rows, columns: {list(df.columns)}", file=sys.stderr)
-        
-        # Mock output
-        test_stats = {
-            "total_rows": len(df),
-            "valid_numbers": len(df) - 10,
-            "blocked_numbers": 10,
-            "final_rows": len(df) - 20,
-            "blocklist_size": 1000,
-            "processing_time": 1.0,
-            "duplicates_removed": 5
-        }
-        
-        print("Test completed successfully", file=sys.stderr)
-        print(json.dumps(test_stats))
-        
+        args = parse_args(sys.argv[1:])
+        if args.worker:
+            worker_loop()
+            return
+        if args.input_file is None:
+            sys.stderr.write(_USAGE)
+            sys.exit(2)
+        if DEBUG:
+            log(f"Arguments parsed successfully: {vars(args)}")
+
+        # Validate the input path before paying the pandas import cost
+        if not os.path.isfile(args.input_file):
+            sys.stderr.write(f"Input file not found: {args.input_file}\n")
+            sys.exit(2)
+
+        test_stats = process(args.input_file, args.phone_column, log)
+
+        log("Test completed successfully")
+        if orjson is not None:
+            # One syscall on the raw fd; flush first so nothing buffered in
+            # the TextIO layer lands after the payload.
+            payload = orjson.dumps(test_stats) + b"\n"
+            sys.stdout.flush()
+            os.write(1, payload)
+        else:
+            print(json.dumps(test_stats))
+
     except Exception as e:
-        print(f"Error occurred: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        # Compact one-line error for the Node parent; the full traceback
+        # (and the traceback module import) only under PHONE_DEBUG.
+        sys.stderr.write(f"ERR: {type(e).__name__}: {e}\n")
+        if DEBUG:
+            import traceback
+            traceback.print_exc(file=sys.stderr)
         sys.exit(1)
+    finally:
+        if debug_lines:
+            sys.stderr.write("\n".join(debug_lines) + "\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()